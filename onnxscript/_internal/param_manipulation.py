@@ -4,23 +4,98 @@
 
 from __future__ import annotations
 
-import collections
-from typing import Any, OrderedDict, Sequence
+from typing import Any, Sequence
 
 from onnxscript import values
 
+_COMPILED_PARAM_SCHEMAS_CACHE_SIZE = 1024
+
+
+class _CompiledParamSchemas:
+    """Lookup tables precomputed from the parameter schemas of an Op or a OnnxFunction.
+
+    Attributes:
+        schemas: The parameter schemas, in order.
+        name_to_index: Mapping from parameter name to its position in ``schemas``.
+        input_indices: Positions of the ONNX inputs.
+        attr_indices: Positions of the ONNX attributes.
+        defaults: Mapping from parameter name to its default value, for parameters
+            that have one.
+        required_mask: Whether the parameter at each position is required.
+        variadic_index: Position of the variadic input, or None if there is none.
+    """
+
+    __slots__ = (
+        "attr_indices",
+        "defaults",
+        "input_indices",
+        "name_to_index",
+        "required_mask",
+        "schemas",
+        "variadic_index",
+    )
+
+    def __init__(self, param_schemas: Sequence[values.ParamSchema]) -> None:
+        self.schemas: tuple[values.ParamSchema, ...] = tuple(param_schemas)
+        self.name_to_index: dict[str, int] = {
+            param.name: i for i, param in enumerate(self.schemas)
+        }
+        self.input_indices: tuple[int, ...] = tuple(
+            i for i, param in enumerate(self.schemas) if param.is_input
+        )
+        self.attr_indices: tuple[int, ...] = tuple(
+            i for i, param in enumerate(self.schemas) if param.is_attribute
+        )
+        self.defaults: dict[str, Any] = {
+            param.name: param.default
+            for param in self.schemas
+            if param.default is not values._EmptyDefault  # pylint: disable=protected-access
+        }
+        self.required_mask: tuple[bool, ...] = tuple(param.required for param in self.schemas)
+        self.variadic_index: int | None = next(
+            (i for i, param in enumerate(self.schemas) if param.is_variadic_input), None
+        )
+
+
+# Keyed by id(); each entry keeps a reference to its schemas so the id stays valid
+_compiled_param_schemas_cache: dict[int, _CompiledParamSchemas] = {}
+
+
+def compile_param_schemas(
+    param_schemas: Sequence[values.ParamSchema] | _CompiledParamSchemas,
+) -> _CompiledParamSchemas:
+    """Return the precompiled lookup tables for the parameter schemas.
+
+    The result is cached for the lifetime of the schemas object, so callers that
+    pass the same tuple repeatedly (e.g. ``Op.param_schemas()``) only pay for the
+    compilation once. Already compiled schemas are returned as is.
+    """
+    if isinstance(param_schemas, _CompiledParamSchemas):
+        return param_schemas
+    compiled = _compiled_param_schemas_cache.get(id(param_schemas))
+    if compiled is not None and compiled.schemas is param_schemas:
+        return compiled
+    compiled = _CompiledParamSchemas(param_schemas)
+    if compiled.schemas is param_schemas:
+        # Only tuples are cached: other sequences are copied and may be mutated
+        if len(_compiled_param_schemas_cache) >= _COMPILED_PARAM_SCHEMAS_CACHE_SIZE:
+            _compiled_param_schemas_cache.clear()
+        _compiled_param_schemas_cache[id(param_schemas)] = compiled
+    return compiled
+
 
 def separate_input_attributes_from_arguments(
-    param_schemas: Sequence[values.ParamSchema],
+    param_schemas: Sequence[values.ParamSchema] | _CompiledParamSchemas,
     args,
     kwargs,
     fill_defaults: bool = True,
     allow_extra_kwargs: bool = False,
-) -> tuple[list[Any], OrderedDict[str, Any]]:
+) -> tuple[list[Any], dict[str, Any]]:
     """Separate Python args and kwargs into ONNX inputs and attributes.
 
     Args:
-        param_schemas: The parameter schemas of an Op or a OnnxFunction.
+        param_schemas: The parameter schemas of an Op or a OnnxFunction, or
+            their compiled form from :func:`compile_param_schemas`.
         args: The Python positional arguments supplied by the caller.
         kwargs: The Python keyword arguments supplied by the caller.
         fill_defaults: Whether to fill the default values for attributes.
@@ -30,7 +105,7 @@ def separate_input_attributes_from_arguments(
     Returns:
         A tuple of two elements:
         - A list of ONNX inputs.
-        - An ordered dictionary of ONNX attribute names and values.
+        - A dictionary of ONNX attribute names and values, in the order of the schemas.
 
     Raises:
         TypeError: When allow_extra_kwargs is False and there are unknown kwargs.
@@ -38,45 +113,55 @@ def separate_input_attributes_from_arguments(
     """
     # args, kwargs and param_schemas should be all in order
     # user may not specify all inputs or attributes
+    compiled = compile_param_schemas(param_schemas)
 
-    all_param_names = {param.name for param in param_schemas}
-    extra_kwargs = set(kwargs).difference(all_param_names)
-    if extra_kwargs and not allow_extra_kwargs:
-        raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
+    if not kwargs and compiled.variadic_index is None and len(args) == len(compiled.schemas):
+        # Fast path: every parameter is supplied positionally, in schema order
+        schemas = compiled.schemas
+        return (
+            [args[i] for i in compiled.input_indices],
+            {schemas[i].name: args[i] for i in compiled.attr_indices},
+        )
+
+    if kwargs and not allow_extra_kwargs:
+        extra_kwargs = kwargs.keys() - compiled.name_to_index.keys()
+        if extra_kwargs:
+            raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
 
     onnx_inputs = []
-    onnx_attributes = collections.OrderedDict()
+    onnx_attributes: dict[str, Any] = {}
+    defaults = compiled.defaults
+    num_args = len(args)
 
-    for i, param in enumerate(param_schemas):
-        if param.is_variadic_input:
+    for i, param in enumerate(compiled.schemas):
+        name = param.name
+        if i == compiled.variadic_index:
             # Exhaust all remaining args
             onnx_inputs.extend(args[i:])
-            args = []
+            num_args = 0
             continue
-        if i < len(args):
+        if i < num_args:
             if param.is_input:
                 onnx_inputs.append(args[i])
             else:
-                onnx_attributes[param.name] = args[i]
-        elif param.name in kwargs:
+                onnx_attributes[name] = args[i]
+        elif name in kwargs:
             if param.is_input:
-                onnx_inputs.append(kwargs[param.name])
+                onnx_inputs.append(kwargs[name])
             else:
-                onnx_attributes[param.name] = kwargs[param.name]
-        elif (
-            param.is_attribute and param.default is not values._EmptyDefault  # pylint: disable=protected-access
-        ):
+                onnx_attributes[name] = kwargs[name]
+        elif not param.is_input and name in defaults:
             # User did not provide the attribute
             if fill_defaults:
-                onnx_attributes[param.name] = param.default
-        elif param.required:
+                onnx_attributes[name] = defaults[name]
+        elif compiled.required_mask[i]:
             raise TypeError(f"Required input '{param}' was not provided")
 
     return onnx_inputs, onnx_attributes
 
 
 def tag_arguments_with_param_schemas(
-    param_schemas: Sequence[values.ParamSchema],
+    param_schemas: Sequence[values.ParamSchema] | _CompiledParamSchemas,
     args,
     kwargs,
     fill_defaults: bool = True,
@@ -85,7 +170,8 @@ def tag_arguments_with_param_schemas(
     """Tag Python args and kwargs with matching ONNX ParamSchema.
 
     Args:
-        param_schemas: The parameter schemas of an Op or a OnnxFunction.
+        param_schemas: The parameter schemas of an Op or a OnnxFunction, or
+            their compiled form from :func:`compile_param_schemas`.
         args: The Python positional arguments supplied by the caller.
         kwargs: The Python keyword arguments supplied by the caller.
         fill_defaults: Whether to fill the default values for attributes.
@@ -104,45 +190,55 @@ def tag_arguments_with_param_schemas(
     """
     # args, kwargs and param_schemas should be all in order
     # user may not specify all inputs or attributes
+    compiled = compile_param_schemas(param_schemas)
 
-    all_param_names = {param.name for param in param_schemas}
-    extra_kwargs = set(kwargs).difference(all_param_names)
-    if extra_kwargs and not allow_extra_kwargs:
-        raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
+    if kwargs and not allow_extra_kwargs:
+        extra_kwargs = kwargs.keys() - compiled.name_to_index.keys()
+        if extra_kwargs:
+            raise TypeError(f"Unexpected keyword arguments '{extra_kwargs}'")
 
     tagged_args: list[tuple[Any, values.ParamSchema]] = []
     tagged_kwargs: dict[str, tuple[Any, values.ParamSchema]] = {}
+    defaults = compiled.defaults
+    num_args = len(args)
 
-    for i, param in enumerate(param_schemas):
-        if param.is_variadic_input:
+    for i, param in enumerate(compiled.schemas):
+        name = param.name
+        if i == compiled.variadic_index:
             # Exhaust all remaining args
             tagged_args.extend((arg, param) for arg in args[i:])
-            args = []
+            num_args = 0
             continue
-        if i < len(args):
+        if i < num_args:
             tagged_args.append((args[i], param))
-        elif param.name in kwargs:
-            tagged_kwargs[param.name] = (kwargs[param.name], param)
-        elif param.default is not values._EmptyDefault:  # pylint: disable=protected-access
+        elif name in kwargs:
+            tagged_kwargs[name] = (kwargs[name], param)
+        elif name in defaults:
             # User did not provide the input/attribute
             if fill_defaults:
-                tagged_kwargs[param.name] = (param.default, param)
-        elif param.required:
+                tagged_kwargs[name] = (defaults[name], param)
+        elif compiled.required_mask[i]:
             raise TypeError(f"Required input/attribute '{param}' was not provided")
 
     return tagged_args, tagged_kwargs
 
 
 def turn_to_kwargs_to_avoid_ordering(
-    param_schemas: Sequence[values.ParamSchema],
+    param_schemas: Sequence[values.ParamSchema] | _CompiledParamSchemas,
     inputs: list[Any],
     attributes: dict[str, Any],
 ) -> dict[str, Any]:
     """Return the inputs and attributes to the order of the function signature."""
-    for idx, param in enumerate(param_schemas):
-        if param.name not in attributes:
-            if param.is_variadic_input:
-                attributes[param.name] = inputs[idx:]
-            elif inputs:
-                attributes[param.name] = inputs.pop(0)
+    compiled = compile_param_schemas(param_schemas)
+    next_input = 0
+    for idx, param in enumerate(compiled.schemas):
+        if param.name in attributes:
+            continue
+        if idx == compiled.variadic_index:
+            # The variadic input takes all remaining inputs
+            attributes[param.name] = inputs[next_input:]
+            next_input = len(inputs)
+        elif next_input < len(inputs):
+            attributes[param.name] = inputs[next_input]
+            next_input += 1
     return attributes
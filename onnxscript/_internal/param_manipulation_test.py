@@ -2,10 +2,9 @@
 # Licensed under the MIT License.
 # mypy: disable-error-code=misc
 
-import collections
+import itertools
 import unittest
-
-import parameterized
+from typing import Any
 
 from onnxscript import INT64, values
 from onnxscript._internal import param_manipulation
@@ -13,11 +12,34 @@ from onnxscript._internal import param_manipulation
 TEST_INPUT = "TEST_INPUT"
 
 
+def _param_schema(
+    name: str,
+    type_: Any,
+    *,
+    is_input: bool,
+    default: Any = values._EmptyDefault,  # pylint: disable=protected-access
+    is_variadic_input: bool = False,
+    required: bool = True,
+) -> values.ParamSchema:
+    return values.ParamSchema(name, type_, default, required, is_input, is_variadic_input)
+
+
+_BASIC_SCHEMAS = (
+    _param_schema("a", INT64, is_input=True),
+    _param_schema("b", int, is_input=False),
+    _param_schema("c", float, default=100.0, is_input=False),
+)
+_VARIADIC_SCHEMAS = (
+    _param_schema("a", INT64, is_input=True, is_variadic_input=True),
+    _param_schema("b", int, is_input=False),
+)
+
+
 class TestSeparateInputAttributesFromArguments(unittest.TestCase):
     """Unit tests for `param_manipulation.separate_input_attributes_from_arguments`."""
 
-    @parameterized.parameterized.expand(
-        [
+    def test_it_is_correct_on(self):
+        cases = [
             (
                 "all_positional",
                 (TEST_INPUT, 42, 0.0),
@@ -61,133 +83,106 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
                 100.0,
             ),
         ]
-    )
-    def test_it_is_correct_on(self, _, args, kwargs, expected_c):
-        param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-            values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
-        )
+        for name, args, kwargs, expected_c in cases:
+            with self.subTest(name):
+                expected_attributes = {"b": 42, "c": expected_c}
 
-        expected_inputs = [TEST_INPUT]
-        expected_attributes = collections.OrderedDict(
-            [
-                ("b", 42),
-                ("c", expected_c),
-            ]
-        )
+                inputs, attributes = (
+                    param_manipulation.separate_input_attributes_from_arguments(
+                        _BASIC_SCHEMAS, args, kwargs
+                    )
+                )
 
-        inputs, attributes = param_manipulation.separate_input_attributes_from_arguments(
-            param_schemas, args, kwargs
-        )
-
-        self.assertEqual(len(inputs), len(expected_inputs))
-        for input_, expected_input in zip(inputs, expected_inputs):
-            self.assertIs(input_, expected_input)
-        self.assertEqual(attributes, expected_attributes)
-
-    @parameterized.parameterized.expand(
-        [
-            (
-                "extra_keyword",
-                (TEST_INPUT, 42, 0.0),
-                {"unknown": -1},
-            ),
-        ]
-    )
-    def test_it_raises_on_extra_args(self, _, args, kwargs):
-        param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-            values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
-        )
+                self.assertEqual(len(inputs), 1)
+                self.assertIs(inputs[0], TEST_INPUT)
+                self.assertEqual(attributes, expected_attributes)
 
+    def test_it_raises_on_extra_args(self):
         with self.assertRaises(TypeError):
             _, _ = param_manipulation.separate_input_attributes_from_arguments(
-                param_schemas, args, kwargs
+                _BASIC_SCHEMAS, (TEST_INPUT, 42, 0.0), {"unknown": -1}
             )
 
-    @parameterized.parameterized.expand(
-        [
-            (True,),
-            (False,),
-        ]
-    )
-    def test_it_raises_on_extra_kwargs_when_not_allow_extra_kwargs(
-        self,
-        fill_defaults: bool,
-    ):
+    def test_it_raises_on_extra_kwargs_when_not_allow_extra_kwargs(self):
+        for fill_defaults in (True, False):
+            with self.subTest(fill_defaults=fill_defaults), self.assertRaises(TypeError):
+                _, _ = param_manipulation.separate_input_attributes_from_arguments(
+                    _BASIC_SCHEMAS,
+                    (TEST_INPUT, 42),
+                    {"c": 1.0, "extra": 42},
+                    fill_defaults=fill_defaults,
+                    allow_extra_kwargs=False,
+                )
+
+    def test_it_does_not_fill_default_when_fill_defaults_is_false(self):
+        for allow_extra_kwargs in (True, False):
+            with self.subTest(allow_extra_kwargs=allow_extra_kwargs):
+                inputs, attributes = (
+                    param_manipulation.separate_input_attributes_from_arguments(
+                        _BASIC_SCHEMAS,
+                        (TEST_INPUT, 42),
+                        {},
+                        fill_defaults=False,
+                        allow_extra_kwargs=allow_extra_kwargs,
+                    )
+                )
+
+                self.assertEqual(inputs, [TEST_INPUT])
+                self.assertEqual(attributes, {"b": 42})
+
+    def test_it_raises_on_insufficient_args(self):
+        for fill_defaults, allow_extra_kwargs in itertools.product([True, False], repeat=2):
+            with self.subTest(
+                fill_defaults=fill_defaults, allow_extra_kwargs=allow_extra_kwargs
+            ), self.assertRaises(TypeError):
+                _, _ = param_manipulation.separate_input_attributes_from_arguments(
+                    _BASIC_SCHEMAS,
+                    (TEST_INPUT,),
+                    {},
+                    fill_defaults=fill_defaults,
+                    allow_extra_kwargs=allow_extra_kwargs,
+                )
+
+    def test_variadic_input_takes_all_positional_args(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-            values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
+            _param_schema("a", INT64, is_input=True, is_variadic_input=True),
+            _param_schema("b", int, default=1, is_input=False),
         )
 
-        with self.assertRaises(TypeError):
-            _, _ = param_manipulation.separate_input_attributes_from_arguments(
-                param_schemas,
-                (TEST_INPUT, 42),
-                {"c": 1.0, "extra": 42},
-                fill_defaults=fill_defaults,
-                allow_extra_kwargs=False,
-            )
-
-    @parameterized.parameterized.expand(
-        [
-            (True,),
-            (False,),
-        ]
-    )
-    def test_it_does_not_fill_default_when_fill_defaults_is_false(
-        self, allow_extra_kwargs: bool
-    ):
-        param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-            values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
+        inputs, attributes = param_manipulation.separate_input_attributes_from_arguments(
+            param_schemas, (TEST_INPUT, TEST_INPUT), {}
         )
 
+        self.assertEqual(inputs, [TEST_INPUT, TEST_INPUT])
+        self.assertEqual(attributes, {"b": 1})
+
+    def test_it_accepts_compiled_param_schemas(self):
+        compiled = param_manipulation.compile_param_schemas(_BASIC_SCHEMAS)
+
         inputs, attributes = param_manipulation.separate_input_attributes_from_arguments(
-            param_schemas,
-            (TEST_INPUT, 42),
-            {},
-            fill_defaults=False,
-            allow_extra_kwargs=allow_extra_kwargs,
+            compiled, (TEST_INPUT,), {"b": 42}
         )
 
         self.assertEqual(inputs, [TEST_INPUT])
-        self.assertEqual(attributes, collections.OrderedDict([("b", 42)]))
-
-    @parameterized.parameterized.expand(
-        [
-            (True, True),
-            (True, False),
-            (False, True),
-            (False, False),
-        ]
-    )
-    def test_it_raises_on_insufficient_args(
-        self, fill_defaults: bool, allow_extra_kwargs: bool
-    ):
+        self.assertEqual(attributes, {"b": 42, "c": 100.0})
+
+    def test_compile_param_schemas_is_cached_per_schemas_object(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-            values.ParamSchema(name="c", type=float, default=100.0, is_input=False),
+            _param_schema("a", INT64, is_input=True),
+            _param_schema("b", int, is_input=False),
         )
+        compiled = param_manipulation.compile_param_schemas(param_schemas)
 
-        with self.assertRaises(TypeError):
-            _, _ = param_manipulation.separate_input_attributes_from_arguments(
-                param_schemas,
-                (TEST_INPUT,),
-                {},
-                fill_defaults=fill_defaults,
-                allow_extra_kwargs=allow_extra_kwargs,
-            )
+        self.assertIs(param_manipulation.compile_param_schemas(param_schemas), compiled)
+        self.assertIs(param_manipulation.compile_param_schemas(compiled), compiled)
+        self.assertEqual(compiled.input_indices, (0,))
+        self.assertEqual(compiled.attr_indices, (1,))
+        self.assertIsNone(compiled.variadic_index)
 
     def test_tag_arguments_with_extra_kwargs_not_allowed(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
+            _param_schema("a", INT64, is_input=True),
+            _param_schema("b", int, is_input=False),
         )
     
         args = (TEST_INPUT,)
@@ -200,11 +195,6 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
 
 
     def test_turn_to_kwargs_with_variadic_inputs(self):
-        param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True, is_variadic_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-        )
-    
         inputs = [TEST_INPUT, TEST_INPUT, TEST_INPUT]
         attributes = {"b": 42}
     
@@ -214,26 +204,38 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
         }
     
         result = param_manipulation.turn_to_kwargs_to_avoid_ordering(
-            param_schemas, inputs, attributes
+            _VARIADIC_SCHEMAS, inputs, attributes
         )
     
         self.assertEqual(result, expected_attributes)
 
 
-    def test_tag_arguments_with_variadic_inputs(self):
+    def test_turn_to_kwargs_with_variadic_inputs_after_other_inputs(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True, is_variadic_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
+            _param_schema("a", INT64, is_input=True),
+            _param_schema("b", INT64, is_input=True, is_variadic_input=True),
+            _param_schema("c", int, is_input=False),
         )
-    
+
+        result = param_manipulation.turn_to_kwargs_to_avoid_ordering(
+            param_schemas, ["x", "y", "z"], {"c": 42}
+        )
+
+        self.assertEqual(result, {"a": "x", "b": ["y", "z"], "c": 42})
+
+    def test_tag_arguments_with_variadic_inputs(self):
         args = (TEST_INPUT, TEST_INPUT, TEST_INPUT)
         kwargs = {"b": 42}
     
-        expected_tagged_args = [(TEST_INPUT, param_schemas[0]), (TEST_INPUT, param_schemas[0]), (TEST_INPUT, param_schemas[0])]
-        expected_tagged_kwargs = {"b": (42, param_schemas[1])}
+        expected_tagged_args = [
+            (TEST_INPUT, _VARIADIC_SCHEMAS[0]),
+            (TEST_INPUT, _VARIADIC_SCHEMAS[0]),
+            (TEST_INPUT, _VARIADIC_SCHEMAS[0]),
+        ]
+        expected_tagged_kwargs = {"b": (42, _VARIADIC_SCHEMAS[1])}
     
         tagged_args, tagged_kwargs = param_manipulation.tag_arguments_with_param_schemas(
-            param_schemas, args, kwargs
+            _VARIADIC_SCHEMAS, args, kwargs
         )
     
         self.assertEqual(tagged_args, expected_tagged_args)
@@ -242,9 +244,9 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
 
     def test_turn_to_kwargs_to_avoid_ordering(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=True),
-            values.ParamSchema(name="c", type=float, is_input=False, default=0.0),
+            _param_schema("a", INT64, is_input=True),
+            _param_schema("b", int, is_input=True),
+            _param_schema("c", float, is_input=False, default=0.0),
         )
     
         inputs = [TEST_INPUT, 42]
@@ -265,9 +267,9 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
 
     def test_tag_arguments_with_param_schemas(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False, default=100),
-            values.ParamSchema(name="c", type=float, is_input=False, default=0.0),
+            _param_schema("a", INT64, is_input=True),
+            _param_schema("b", int, is_input=False, default=100),
+            _param_schema("c", float, is_input=False, default=0.0),
         )
     
         args = (TEST_INPUT,)
@@ -289,8 +291,8 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
 
     def test_required_input_not_provided(self):
         param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True, required=True),
-            values.ParamSchema(name="b", type=int, is_input=False, default=100),
+            _param_schema("a", INT64, is_input=True, required=True),
+            _param_schema("b", int, is_input=False, default=100),
         )
     
         args = ()
@@ -303,22 +305,16 @@ class TestSeparateInputAttributesFromArguments(unittest.TestCase):
 
 
     def test_variadic_inputs(self):
-        param_schemas = (
-            values.ParamSchema(name="a", type=INT64, is_input=True, is_variadic_input=True),
-            values.ParamSchema(name="b", type=int, is_input=False),
-        )
-    
         args = (TEST_INPUT, TEST_INPUT, TEST_INPUT)
         kwargs = {"b": 42}
     
-        expected_inputs = [TEST_INPUT, TEST_INPUT, TEST_INPUT]
-        expected_attributes = collections.OrderedDict([("b", 42)])
+        expected_attributes = {"b": 42}
     
         inputs, attributes = param_manipulation.separate_input_attributes_from_arguments(
-            param_schemas, args, kwargs
+            _VARIADIC_SCHEMAS, args, kwargs
         )
     
-        self.assertEqual(inputs, expected_inputs)
+        self.assertEqual(inputs, [TEST_INPUT] * 3)
         self.assertEqual(attributes, expected_attributes)
 
 
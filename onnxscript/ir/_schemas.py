@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import collections.abc
 import dataclasses
+import functools
 import inspect
 import logging
+import sys
 import types
 import typing
-from typing import Any, Iterator, Mapping, Optional, Sequence, TypeVar, Union
+from typing import AbstractSet, Any, Iterator, Mapping, Optional, Sequence, TypeVar, Union
 
 import onnx
 
@@ -18,8 +20,21 @@ from onnxscript import ir
 logger = logging.getLogger(__name__)
 
 
+# Generate __slots__ for the schema dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # A special value to indicate that the default value is not specified
 class _Empty:
+    __slots__ = ()
+    _instance: _Empty | None = None
+
+    def __new__(cls):
+        # Singleton so that it can be compared by identity
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __repr__(self):
         return "_EMPTY_DEFAULT"
 
@@ -51,10 +66,22 @@ _LIST_TYPE_TO_ATTR_TYPE = {
     ir.GraphProtocol: ir.AttributeType.GRAPHS,
 }
 
-_ALL_VALUE_TYPES = (
-    {ir.TensorType(dtype) for dtype in ir.DataType}
-    | {ir.SequenceType(ir.TensorType(dtype)) for dtype in ir.DataType}
-    | {ir.OptionalType(ir.TensorType(dtype)) for dtype in ir.DataType}
+# Shared type instances used by the schemas, keyed by dtype. ir.TensorType is
+# mutable (Value.dtype updates it in place), so the instances are pooled here
+# for the read-only schema tables instead of being interned in the class itself.
+_TENSOR_TYPES: Mapping[ir.DataType, ir.TensorType] = {
+    dtype: ir.TensorType(dtype) for dtype in ir.DataType
+}
+_SEQUENCE_TENSOR_TYPES: Mapping[ir.DataType, ir.SequenceType] = {
+    dtype: ir.SequenceType(tensor_type) for dtype, tensor_type in _TENSOR_TYPES.items()
+}
+
+_ALL_TENSOR_TYPES: frozenset[ir.TensorType] = frozenset(_TENSOR_TYPES.values())
+
+_ALL_VALUE_TYPES = frozenset(
+    _ALL_TENSOR_TYPES
+    | set(_SEQUENCE_TENSOR_TYPES.values())
+    | {ir.OptionalType(tensor_type) for tensor_type in _TENSOR_TYPES.values()}
 )
 
 # TypeAnnotationValue represents the (value of) valid type-annotations recognized
@@ -69,21 +96,25 @@ _ALL_VALUE_TYPES = (
 TypeAnnotationValue = Any
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TypeConstraintParam:
     """Type constraint for a parameter.
 
     Attributes:
         name: Name of the parameter. E.g. "TFloat"
-        allowed_types: Allowed types for the parameter.
+        allowed_types: Allowed types for the parameter. Stored as a frozenset.
     """
 
     name: str
-    allowed_types: set[ir.TypeProtocol]
+    allowed_types: AbstractSet[ir.TypeProtocol]
     description: str = ""
 
+    def __post_init__(self):
+        if not isinstance(self.allowed_types, frozenset):
+            object.__setattr__(self, "allowed_types", frozenset(self.allowed_types))
+
     def __hash__(self) -> int:
-        return hash((self.name, tuple(self.allowed_types)))
+        return hash((self.name, self.allowed_types))
 
     def __str__(self) -> str:
         allowed_types_str = " | ".join(str(t) for t in self.allowed_types)
@@ -91,14 +122,14 @@ class TypeConstraintParam:
 
     @classmethod
     def any_tensor(cls, name: str, description: str = "") -> TypeConstraintParam:
-        return cls(name, {ir.TensorType(dtype) for dtype in ir.DataType}, description)
+        return cls(name, _ALL_TENSOR_TYPES, description)
 
     @classmethod
     def any_value(cls, name: str, description: str = "") -> TypeConstraintParam:
-        return cls(name, _ALL_VALUE_TYPES, description)  # type: ignore[arg-type]
+        return cls(name, _ALL_VALUE_TYPES, description)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Parameter:
     """A formal parameter of an operator."""
 
@@ -119,7 +150,7 @@ class Parameter:
         return self.default is not _EMPTY_DEFAULT
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AttributeParameter:
     """A parameter in the function signature that represents an ONNX attribute."""
 
@@ -138,12 +169,21 @@ class AttributeParameter:
         return self.default is not None
 
 
+def _sequence_type(elem_type: ir.TypeProtocol) -> ir.SequenceType:
+    """Return a sequence type of elem_type, reusing the shared instance for tensors."""
+    if elem_type is _TENSOR_TYPES.get(elem_type.dtype):
+        return _SEQUENCE_TENSOR_TYPES[elem_type.dtype]
+    return ir.SequenceType(elem_type)
+
+
+@functools.lru_cache(maxsize=256)
 def _get_type_from_str(
     type_str: str,
 ) -> ir.TensorType | ir.SequenceType | ir.OptionalType:
     """Converter a type_str from ONNX OpSchema to ir.TypeProtocol.
 
     A type str has the form of "tensor(float)" or composite type like "seq(tensor(float))".
+    The result is cached and shared between callers, so it must not be modified.
     """
     # Split the type_str a sequence types and dtypes
     # 1. Remove the ending ")"
@@ -155,14 +195,14 @@ def _get_type_from_str(
     dtype = ir.DataType[type_parts[-1].upper()]
 
     # Create a place holder type first
-    type_: ir.TypeProtocol = ir.TensorType(ir.DataType.UNDEFINED)
+    type_: ir.TypeProtocol = _TENSOR_TYPES[ir.DataType.UNDEFINED]
 
     # Construct the type
     for type_part in reversed(type_parts[:-1]):
         if type_part == "tensor":
-            type_ = ir.TensorType(dtype)
+            type_ = _TENSOR_TYPES[dtype]
         elif type_part == "seq":
-            type_ = ir.SequenceType(type_)
+            type_ = _sequence_type(type_)
         elif type_part == "optional":
             type_ = ir.OptionalType(type_)
         else:
@@ -170,6 +210,18 @@ def _get_type_from_str(
     return type_  # type: ignore[return-value]
 
 
+@functools.lru_cache(maxsize=512)
+def _type_constraint_for(type_str: str, name: str) -> TypeConstraintParam:
+    """Return the type constraint for a plain type_str like 'tensor(float)'.
+
+    The constraint is named after the parameter, so the name is part of the cache key.
+    TypeConstraintParam is immutable, which makes sharing the cached instance safe.
+    """
+    return TypeConstraintParam(
+        name=name, allowed_types=frozenset({_get_type_from_str(type_str)})
+    )
+
+
 def _convert_formal_parameter(
     param: onnx.defs.OpSchema.FormalParameter,
     type_constraints: Mapping[str, TypeConstraintParam],
@@ -179,10 +231,7 @@ def _convert_formal_parameter(
         type_constraint = type_constraints[param.type_str]
     else:
         # param.type_str can be a plain type like 'int64'.
-        type_constraint = TypeConstraintParam(
-            name=param.name,
-            allowed_types={_get_type_from_str(param.type_str)},
-        )
+        type_constraint = _type_constraint_for(param.type_str, param.name)
     return Parameter(
         name=param.name,
         type_constraint=type_constraint,
@@ -234,6 +283,7 @@ def _get_attr_type(type_: type) -> ir.AttributeType:
     return ir.AttributeType.UNDEFINED
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_type_constraint_name(type_: TypeAnnotationValue) -> str | None:
     """Returns the name of the type constraint for a given type annotation.
 
@@ -261,13 +311,17 @@ def _get_type_constraint_name(type_: TypeAnnotationValue) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_allowed_types_from_type_annotation(
     type_: TypeAnnotationValue,
-) -> set[ir.TypeProtocol]:
-    """Obtain the allowed types from a type annotation."""
+) -> frozenset[ir.TypeProtocol]:
+    """Obtain the allowed types from a type annotation.
+
+    The result is cached per annotation and must be treated as read-only.
+    """
     if type_ is onnxscript.onnx_types.TensorType:
         # Any tensor type
-        return {ir.TensorType(dtype) for dtype in ir.DataType}
+        return _ALL_TENSOR_TYPES
 
     allowed_types: set[ir.TypeProtocol]
 
@@ -279,13 +333,12 @@ def _get_allowed_types_from_type_annotation(
         else:
             bound = type_.__bound__
             if bound is None:
-                allowed_types = _ALL_VALUE_TYPES  # type: ignore[assignment]
-            else:
-                allowed_types.update(_get_allowed_types_from_type_annotation(bound))
-        return allowed_types
+                return _ALL_VALUE_TYPES
+            allowed_types.update(_get_allowed_types_from_type_annotation(bound))
+        return frozenset(allowed_types)
     if hasattr(type_, "dtype"):
         # A single tensor type like INT64, FLOAT, etc.
-        return {ir.TensorType(ir.DataType(type_.dtype))}
+        return frozenset({_TENSOR_TYPES[ir.DataType(type_.dtype)]})
     if _is_optional(type_):
         allowed_types = set()
         subtypes = typing.get_args(type_)
@@ -294,7 +347,7 @@ def _get_allowed_types_from_type_annotation(
                 continue
             allowed_types.update(_get_allowed_types_from_type_annotation(subtype))
         # NOTE: We do not consider dynamic optional types like optional(float) because they are not very useful.
-        return allowed_types
+        return frozenset(allowed_types)
 
     origin_type = typing.get_origin(type_)
     if origin_type is Union:
@@ -305,16 +358,16 @@ def _get_allowed_types_from_type_annotation(
                 None
             ), "Union should not contain None type because it is handled by _is_optional."
             allowed_types.update(_get_allowed_types_from_type_annotation(subtype))
-        return allowed_types
+        return frozenset(allowed_types)
 
     if isinstance(origin_type, type) and issubclass(origin_type, Sequence):
         subtypes = typing.get_args(type_)
-        return {
-            ir.SequenceType(t) for t in _get_allowed_types_from_type_annotation(subtypes[0])
-        }
+        return frozenset(
+            _sequence_type(t) for t in _get_allowed_types_from_type_annotation(subtypes[0])
+        )
 
     # Allow everything by default
-    return _ALL_VALUE_TYPES  # type: ignore[return-value]
+    return _ALL_VALUE_TYPES
 
 
 @dataclasses.dataclass
@@ -375,9 +428,9 @@ class OpSignature:
         type_constraints = {
             constraint.type_param_str: TypeConstraintParam(
                 name=constraint.type_param_str,
-                allowed_types={
+                allowed_types=frozenset(
                     _get_type_from_str(type_str) for type_str in constraint.allowed_type_strs
-                },
+                ),
                 description=constraint.description,
             )
             for constraint in op_schema.type_constraints
@@ -2,30 +2,38 @@
 # Licensed under the MIT License.
 from __future__ import annotations
 
+import copy
+import sys
 import unittest
-from typing import Any, Optional, Sequence, TypeVar, Union
+from typing import Optional, Sequence, TypeVar, Union
+from unittest import mock
 
-import parameterized
+import onnx
 
 import onnxscript
 import onnxscript.testing
 from onnxscript import FLOAT, INT64, ir
 from onnxscript.ir import _schemas
 
-import unittest.mock
-import onnx
 _TestTypeVarConstraints = TypeVar("_TestTypeVarConstraints", INT64, FLOAT)
 _TestTypeVarOneBound = TypeVar("_TestTypeVarOneBound", bound=INT64)
 _TestTypeVarTwoBound = TypeVar("_TestTypeVarTwoBound", bound=Union[INT64, FLOAT])
 
 
 class TypeConversionFunctionsTest(unittest.TestCase):
-    @parameterized.parameterized.expand(
-        [
+    @classmethod
+    def setUpClass(cls):
+        cls._ALL_TENSOR = frozenset(ir.TensorType(dtype) for dtype in ir.DataType)
+        cls._ALL_SEQ_TENSOR = frozenset(
+            ir.SequenceType(ir.TensorType(dtype)) for dtype in ir.DataType
+        )
+
+    def test_pytype_to_ir_type(self):
+        cases = [
             (
                 "tensor_type_all",
                 onnxscript.onnx_types.TensorType,
-                {ir.TensorType(dtype) for dtype in ir.DataType},
+                self._ALL_TENSOR,
             ),
             ("tensor_type", INT64, {ir.TensorType(ir.DataType.INT64)}),
             (
@@ -57,7 +65,7 @@ class TypeConversionFunctionsTest(unittest.TestCase):
             (
                 "optional_tensor_type_all",
                 Optional[onnxscript.onnx_types.TensorType],
-                {ir.TensorType(dtype) for dtype in ir.DataType},
+                self._ALL_TENSOR,
             ),
             (
                 "optional_tensor_type",
@@ -97,7 +105,7 @@ class TypeConversionFunctionsTest(unittest.TestCase):
             (
                 "sequence_type_all",
                 Sequence[onnxscript.onnx_types.TensorType],
-                {ir.SequenceType(ir.TensorType(dtype)) for dtype in ir.DataType},
+                self._ALL_SEQ_TENSOR,
             ),
             (
                 "sequence_type",
@@ -144,12 +152,15 @@ class TypeConversionFunctionsTest(unittest.TestCase):
                 },
             ),
         ]
-    )
-    def test_pytype_to_ir_type(self, _, pytype: Any, expected: set[ir.TypeProtocol]):
-        self.assertEqual(_schemas._get_allowed_types_from_type_annotation(pytype), expected)  # pylint: disable=protected-access
+        for name, pytype, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(
+                    _schemas._get_allowed_types_from_type_annotation(pytype),  # pylint: disable=protected-access
+                    expected,
+                )
 
-    @parameterized.parameterized.expand(
-        [
+    def test_get_type_constraint_name(self):
+        cases = [
             ("type_var", _TestTypeVarConstraints, "_TestTypeVarConstraints"),
             ("type_var_bound", _TestTypeVarOneBound, "_TestTypeVarOneBound"),
             (
@@ -169,12 +180,18 @@ class TypeConversionFunctionsTest(unittest.TestCase):
             ("optional_sequence_type", Optional[Sequence[INT64]], None),
             ("optional_union_type", Optional[Union[INT64, FLOAT]], None),
         ]
-    )
-    def test_get_type_constraint_name(self, _: str, pytype: Any, expected: str | None):
-        self.assertEqual(_schemas._get_type_constraint_name(pytype), expected)  # pylint: disable=protected-access
+        for name, pytype, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(_schemas._get_type_constraint_name(pytype), expected)  # pylint: disable=protected-access
+
+    def test_get_allowed_types_from_type_annotation_returns_cached_frozenset(self):
+        first = _schemas._get_allowed_types_from_type_annotation(Optional[INT64])  # pylint: disable=protected-access
+        second = _schemas._get_allowed_types_from_type_annotation(Optional[INT64])  # pylint: disable=protected-access
+        self.assertIsInstance(first, frozenset)
+        self.assertIs(first, second)
 
     def test_convert_formal_parameter_plain_type(self):
-        mock_param = unittest.mock.Mock()
+        mock_param = mock.Mock()
         mock_param.type_str = "tensor(float)"
         mock_param.name = "param"
         mock_param.option = onnx.defs.OpSchema.FormalParameterOption.Single
@@ -182,6 +199,9 @@ class TypeConversionFunctionsTest(unittest.TestCase):
         parameter = _schemas._convert_formal_parameter(mock_param, type_constraints)
         self.assertEqual(parameter.name, "param")
         self.assertTrue(ir.TensorType(ir.DataType.FLOAT) in parameter.type_constraint.allowed_types)
+        # The type constraint for a plain type is shared between conversions
+        other_parameter = _schemas._convert_formal_parameter(mock_param, type_constraints)  # pylint: disable=protected-access
+        self.assertIs(other_parameter.type_constraint, parameter.type_constraint)
 
 
     def test_type_constraint_param_str_single_allowed_type(self):
@@ -193,10 +213,36 @@ class TypeConversionFunctionsTest(unittest.TestCase):
         self.assertEqual(str(type_constraint), expected_str)
 
 
+    def test_type_constraint_param_stores_allowed_types_as_frozenset(self):
+        allowed_types = {ir.TensorType(ir.DataType.FLOAT), ir.TensorType(ir.DataType.INT64)}
+        type_constraint = _schemas.TypeConstraintParam(name="T", allowed_types=allowed_types)
+        self.assertIsInstance(type_constraint.allowed_types, frozenset)
+        self.assertEqual(type_constraint.allowed_types, allowed_types)
+        self.assertEqual(
+            hash(type_constraint),
+            hash(_schemas.TypeConstraintParam(name="T", allowed_types=set(allowed_types))),
+        )
+
+
     def test_get_type_from_str_unknown_type_part(self):
         with self.assertRaises(ValueError) as context:
             _schemas._get_type_from_str("unknown(float)")
         self.assertIn("Unknown type part: 'unknown'", str(context.exception))
+        # Failures are not cached
+        with self.assertRaises(ValueError):
+            _schemas._get_type_from_str("unknown(float)")  # pylint: disable=protected-access
+
+
+    def test_get_type_from_str_reuses_shared_type_instances(self):
+        tensor_type = _schemas._get_type_from_str("tensor(float)")  # pylint: disable=protected-access
+        sequence_type = _schemas._get_type_from_str("seq(tensor(float))")  # pylint: disable=protected-access
+        self.assertIs(tensor_type, _schemas._get_type_from_str("tensor(float)"))  # pylint: disable=protected-access
+        self.assertIs(sequence_type, _schemas._get_type_from_str("seq(tensor(float))"))  # pylint: disable=protected-access
+        self.assertIs(sequence_type.elem_type, tensor_type)
+        self.assertIs(
+            _schemas._get_type_from_str("optional(seq(tensor(float)))"),  # pylint: disable=protected-access
+            _schemas._get_type_from_str("optional(seq(tensor(float)))"),  # pylint: disable=protected-access
+        )
 
 
     def test_parameter_has_default(self):
@@ -225,10 +271,25 @@ class TypeConversionFunctionsTest(unittest.TestCase):
         self.assertEqual(param.allowed_types, expected_types)
 
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots require Python 3.10")
+    def test_schema_classes_do_not_have_instance_dict(self):
+        type_constraint = _schemas.TypeConstraintParam.any_tensor("T")
+        param = _schemas.Parameter(
+            name="param", type_constraint=type_constraint, required=True, variadic=False
+        )
+        self.assertFalse(hasattr(type_constraint, "__dict__"))
+        self.assertFalse(hasattr(param, "__dict__"))
+        self.assertFalse(hasattr(_schemas._EMPTY_DEFAULT, "__dict__"))  # pylint: disable=protected-access
+
+
     def test_empty_class_representation(self):
         empty_instance = _schemas._Empty()
         self.assertEqual(repr(empty_instance), "_EMPTY_DEFAULT")
 
+    def test_empty_class_is_a_singleton(self):
+        self.assertIs(_schemas._Empty(), _schemas._EMPTY_DEFAULT)  # pylint: disable=protected-access
+        self.assertIs(copy.deepcopy(_schemas._EMPTY_DEFAULT), _schemas._EMPTY_DEFAULT)  # pylint: disable=protected-access
+
 
 
 if __name__ == "__main__":
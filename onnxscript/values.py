@@ -6,6 +6,7 @@ import dataclasses
 import functools
 import inspect
 import logging
+import sys
 import types
 import typing
 from enum import IntFlag
@@ -47,6 +48,9 @@ _ATTRIBUTE_TYPE_TO_PYTHON_TYPE = {
 # A special value to indicate that the default value is not specified
 _EmptyDefault = object()
 
+# dataclasses can only generate __slots__ (with field defaults) from Python 3.10
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,7 +132,7 @@ class Opset:
 # ONNX ops
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ParamSchema:
     """A schema for a parameter of an Op or a OnnxFunction.
 